@@ -2804,6 +2804,9 @@ from %s import *
         component_graph = pyxb.utils.utility.Graph()
         need_visit = components.copy()
         bindable_fn = lambda _c: isinstance(_c, xs.structures.ElementDeclaration) or _c.isTypeDefinition()
+        # Components are typically required by many others; decide once per
+        # required component whether it lies outside the graph.
+        excluded = set()
         while 0 < len(need_visit):
             c = need_visit.pop()
             assert c is not None
@@ -2812,15 +2815,21 @@ from %s import *
             component_graph.addNode(c)
             br = c.bindingRequires(reset=True, include_lax=include_lax)
             for cd in br:
+                if cd in components:
+                    component_graph.addEdge(c, cd)
+                    continue
+                if cd in excluded:
+                    continue
                 assert bindable_fn(cd) or include_lax, '%s produced %s in requires' % (type(c), type(cd))
                 if cd._objectOrigin() is None:
                     assert isinstance(cd, (pyxb.xmlschema.structures.Annotation, pyxb.xmlschema.structures.Wildcard))
-                    continue
-                if (cd._objectOrigin().moduleRecord() in self.__moduleRecords) and not (cd in components):
+                    excluded.add(cd)
+                elif cd._objectOrigin().moduleRecord() in self.__moduleRecords:
                     components.add(cd)
                     need_visit.add(cd)
-                if cd in components:
                     component_graph.addEdge(c, cd)
+                else:
+                    excluded.add(cd)
         return component_graph
 
     def __resolveComponentDependencies (self):
@@ -2992,7 +3001,8 @@ from %s import *
         if archive_file is not None:
             ns_archive = pyxb.namespace.archive.NamespaceArchive(generation_uid=self.generationUID())
             try:
-                ns_archive.writeNamespaces(pyxb.utils.utility.OpenOrCreate(archive_file))
+                with pyxb.utils.utility.OpenOrCreate(archive_file) as output:
+                    ns_archive.writeNamespaces(output)
                 _log.info('Saved parsed schema to %s URI', archive_file)
             except Exception as e:
                 _log.exception('Failure saving preprocessed schema to %s', archive_file)
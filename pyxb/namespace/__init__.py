@@ -264,7 +264,10 @@ class NamedObjectMap (dict):
     def __init__ (self, category, namespace, *args, **kw):
         self.__category = category
         self.__namespace = namespace
-        super(NamedObjectMap, self).__init__(*args, **kw)
+        # Maps are normally created empty, which dict.__new__ has already
+        # arranged.
+        if args or kw:
+            dict.__init__(self, *args, **kw)
 
 class _NamespaceCategory_mixin (pyxb.cscRoot):
     """Mix-in that aggregates those aspects of XMLNamespaces that hold
@@ -291,6 +294,10 @@ class _NamespaceCategory_mixin (pyxb.cscRoot):
 
         This one handles category-related data."""
         getattr(super(_NamespaceCategory_mixin, self), '_reset', lambda *args, **kw: None)()
+        # Discard any accessors memoized against the previous category maps
+        if self.__categoryMap:
+            for category in self.__categoryMap:
+                self.__dict__.pop(category + 's', None)
         self.__categoryMap = { }
 
     def categories (self):
@@ -308,14 +315,20 @@ class _NamespaceCategory_mixin (pyxb.cscRoot):
         except KeyError:
             raise pyxb.NamespaceError(self, '%s has no category %s' % (self, category))
 
-    def __defineCategoryAccessors (self):
-        """Define public methods on the Namespace which provide access to
+    def __getattr__ (self, name):
+        """Provide public methods on the Namespace which give access to
         individual NamedObjectMaps based on their category.
 
-        """
-        for category in self.categories():
-            accessor_name = category + 's'
-            setattr(self, accessor_name, lambda _map=self.categoryMap(category): _map)
+        The accessor is created on first use and memoized in the instance, so
+        subsequent lookups do not come through here."""
+        category_map = self.__categoryMap
+        if name.endswith('s') and (category_map is not None):
+            named_objects = category_map.get(name[:-1])
+            if named_objects is not None:
+                accessor = lambda _map=named_objects: _map
+                self.__dict__[name] = accessor
+                return accessor
+        raise AttributeError(name)
 
     def configureCategories (self, categories):
         """Ensure there is a map for each of the given categories.
@@ -326,12 +339,12 @@ class _NamespaceCategory_mixin (pyxb.cscRoot):
         Existing maps are not affected."""
 
         self._activate()
-        if self.__categoryMap is None:
-            self.__categoryMap = { }
+        category_map = self.__categoryMap
+        if category_map is None:
+            category_map = self.__categoryMap = { }
         for category in categories:
-            if not (category in self.__categoryMap):
-                self.__categoryMap[category] = NamedObjectMap(category, self)
-        self.__defineCategoryAccessors()
+            if not (category in category_map):
+                category_map[category] = NamedObjectMap(category, self)
         return self
 
     def addCategoryObject (self, category, local_name, named_object):
@@ -376,16 +389,15 @@ class _NamespaceCategory_mixin (pyxb.cscRoot):
     # tthe moment, we do not support aggregating components defined separately
     # into the same namespace.  That should be done at the schema level using
     # the "include" element.
+    #
+    # The category maps are handed out as live references and updated in
+    # place, so rather than maintain a population count that could drift,
+    # stop at the first non-empty map.
     def __checkCategoriesEmpty (self):
         if self.__categoryMap is None:
             return True
         assert isinstance(self.__categoryMap, dict)
-        if 0 == len(self.__categoryMap):
-            return True
-        for k in self.categories():
-            if 0 < len(self.categoryMap(k)):
-                return False
-        return True
+        return not any(six.itervalues(self.__categoryMap))
 
     def _namedObjects (self):
         objects = set()
@@ -397,9 +409,8 @@ class _NamespaceCategory_mixin (pyxb.cscRoot):
         """Add the named objects from the given map into the set held by this namespace.
         It is an error to name something which is already present."""
         self.configureCategories(six.iterkeys(category_map))
-        for category in six.iterkeys(category_map):
-            current_map = self.categoryMap(category)
-            new_map = category_map[category]
+        for (category, new_map) in six.iteritems(category_map):
+            current_map = self.__categoryMap[category]
             for (local_name, component) in six.iteritems(new_map):
                 existing_component = current_map.get(local_name)
                 if existing_component is None:
@@ -408,7 +419,6 @@ class _NamespaceCategory_mixin (pyxb.cscRoot):
                     existing_component._updateFromOther(component)
                 else:
                     raise pyxb.NamespaceError(self, 'Load attempted to override %s %s in %s' % (category, local_name, self.uri()))
-        self.__defineCategoryAccessors()
 
     def hasSchemaComponents (self):
         """Return C{True} iff schema components have been associated with this namespace.
@@ -501,6 +511,10 @@ class _NamespaceComponentAssociation_mixin (pyxb.cscRoot):
     # namespace.
     __components = None
 
+    # Cached frozenset copy of __components, or None if the set has changed
+    # since the copy was made.
+    __componentsFrozen = None
+
     def _reset (self):
         """CSC extension to reset fields of a Namespace.
 
@@ -508,16 +522,23 @@ class _NamespaceComponentAssociation_mixin (pyxb.cscRoot):
         namespace."""
         getattr(super(_NamespaceComponentAssociation_mixin, self), '_reset', lambda *args, **kw: None)()
         self.__components = set()
+        self.__componentsFrozen = None
         self.__origins = set()
         self.__schemaMap = { }
 
     def _associateComponent (self, component):
         """Record that the responsibility for the component belongs to this namespace."""
         self._activate()
-        assert self.__components is not None
+        components = self.__components
+        assert components is not None
         assert isinstance(component, _ComponentDependency_mixin)
-        assert component not in self.__components
-        self.__components.add(component)
+        # Detect duplicates from the change in size, so the set is probed
+        # only once per association.
+        if __debug__:
+            num_components = len(components)
+        components.add(component)
+        assert len(components) > num_components, 'Duplicate association of %s' % (component,)
+        self.__componentsFrozen = None
 
     def _replaceComponent_csc (self, existing_def, replacement_def):
         """Replace a component definition in the set of associated components.
@@ -527,6 +548,7 @@ class _NamespaceComponentAssociation_mixin (pyxb.cscRoot):
         self.__components.remove(existing_def)
         if replacement_def is not None:
             self.__components.add(replacement_def)
+        self.__componentsFrozen = None
         return getattr(super(_NamespaceComponentAssociation_mixin, self), '_replaceComponent_csc', lambda *args, **kw: replacement_def)(existing_def, replacement_def)
 
     def addSchema (self, schema):
@@ -560,7 +582,9 @@ class _NamespaceComponentAssociation_mixin (pyxb.cscRoot):
     def components (self):
         """Return a frozenset of all components, named or unnamed, belonging
         to this namespace."""
-        return frozenset(self.__components)
+        if self.__componentsFrozen is None:
+            self.__componentsFrozen = frozenset(self.__components)
+        return self.__componentsFrozen
 
     def _releaseNamespaceContexts (self):
         for c in self.__components:
@@ -616,6 +640,11 @@ class Namespace (_NamespaceCategory_mixin, resolution._NamespaceResolution_mixin
     # A set of all absent namespaces created.
     __AbsentNamespaces = set()
 
+    # A map from the module variable names of built-in namespaces (the
+    # builtin_namespace constructor parameter) to their instances.  Used to
+    # resolve forward references by name among the built-in namespaces.
+    __BuiltinNamespaceMap = { }
+
     # Optional description of the namespace
     __description = None
 
@@ -718,7 +747,13 @@ class Namespace (_NamespaceCategory_mixin, resolution._NamespaceResolution_mixin
                     raise pyxb.UsageError('Unable to reconstruct instance of absent namespace')
                 return ns
             raise pyxb.LogicError('Unrecognized serialized namespace variant %s uid %s' % (variant, uid))
-        elif not (uri in cls.__Registry):
+        if type(uri) is str:
+            # Intern the URI so every lookup shares one string object with
+            # the registry key, and interned DOM namespace URIs match the
+            # instance URI by identity in nodeIsNamed.  Subclasses such as
+            # xs.anyURI cannot be interned; they are registered as given.
+            uri = six.moves.intern(uri)
+        if not (uri in cls.__Registry):
             instance = object.__new__(cls)
             # Do this one step of __init__ so we can do checks during unpickling
             instance.__uri = uri
@@ -774,6 +809,8 @@ class Namespace (_NamespaceCategory_mixin, resolution._NamespaceResolution_mixin
         self.__description = description
         self.__isBuiltinNamespace = is_builtin_namespace
         self.__builtinNamespaceVariable = builtin_namespace
+        if is_builtin_namespace:
+            self.__BuiltinNamespaceMap[builtin_namespace] = self
         self.__builtinModulePath = builtin_module_path
         self.__isUndeclaredNamespace = is_undeclared_namespace
         self.__isLoadedNamespace = is_loaded_namespace
@@ -894,7 +931,16 @@ class Namespace (_NamespaceCategory_mixin, resolution._NamespaceResolution_mixin
         return self.__description
 
     def nodeIsNamed (self, node, *local_names):
-        return (node.namespaceURI == self.uri()) and (node.localName in local_names)
+        """Return C{True} iff C{node} is in this namespace and has one of
+        the given local names.
+
+        @param local_names: The acceptable local names, either as individual
+        strings or as a single C{frozenset} which callers matching a fixed
+        vocabulary should construct once and reuse."""
+        if (1 == len(local_names)) and isinstance(local_names[0], frozenset):
+            local_names = local_names[0]
+        node_uri = node.namespaceURI
+        return ((node_uri is self.__uri) or (node_uri == self.__uri)) and (node.localName in local_names)
 
     def createExpandedName (self, local_name):
         return ExpandedName(self, local_name)
@@ -904,21 +950,26 @@ class Namespace (_NamespaceCategory_mixin, resolution._NamespaceResolution_mixin
 
         Well, no, not really.  Because namespace instances must be unique, we
         represent them as their URI, and that's done by __getnewargs__
-        above.  All the interesting information is in the ModuleRecords."""
-        return {}
+        above.  All the interesting information is in the ModuleRecords.
+
+        Returning C{None} rather than an empty dictionary keeps the pickler
+        from writing (and the unpickler from applying) a state update for
+        every namespace instance in the archive."""
+        return None
 
     def _defineBuiltins_ox (self, structures_module):
         pass
 
     __definedBuiltins = False
     def _defineBuiltins (self, structures_module):
+        if self.__definedBuiltins:
+            return self
         assert self.isBuiltinNamespace()
-        if not self.__definedBuiltins:
-            from pyxb.namespace import builtin
-            mr = self.lookupModuleRecordByUID(builtin.BuiltInObjectUID, create_if_missing=True, module_path=self.__builtinModulePath)
-            self._defineBuiltins_ox(structures_module)
-            self.__definedBuiltins = True
-            mr.markIncorporated()
+        from pyxb.namespace import builtin
+        mr = self.lookupModuleRecordByUID(builtin.BuiltInObjectUID, create_if_missing=True, module_path=self.__builtinModulePath)
+        self._defineBuiltins_ox(structures_module)
+        self.__definedBuiltins = True
+        mr.markIncorporated()
         return self
 
     def _loadComponentsFromArchives (self, structures_module):
@@ -1022,7 +1073,10 @@ class Namespace (_NamespaceCategory_mixin, resolution._NamespaceResolution_mixin
         if nsval is None:
             return self
         if isinstance(nsval, six.string_types):
-            nsval = globals().get(nsval)
+            if nsval in self.__BuiltinNamespaceMap:
+                nsval = self.__BuiltinNamespaceMap[nsval]
+            else:
+                nsval = globals().get(nsval)
         if isinstance(nsval, Namespace):
             return nsval
         raise pyxb.LogicError('Cannot identify namespace from %s' % (nsval,))
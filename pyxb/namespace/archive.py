@@ -16,7 +16,9 @@
 """Classes and global objects related to archiving U{XML
 Namespaces<http://www.w3.org/TR/2006/REC-xml-names-20060816/index.html>}."""
 
+import io
 import logging
+import mmap
 import os
 import os.path
 import pyxb
@@ -46,7 +48,11 @@ def GetArchivePath ():
 
 # Stuff required for pickling
 from pyxb.utils.six.moves import cPickle as pickle
-import re
+
+PickleProtocol = pickle.HIGHEST_PROTOCOL
+"""The pickle protocol used when writing namespace archives.  Binary
+protocols are much faster to load than the text protocol, and the unpickler
+detects the protocol automatically."""
 
 class NamespaceArchive (object):
     """Represent a file from which one or more namespaces can be read, or to
@@ -55,7 +61,7 @@ class NamespaceArchive (object):
     # A code used to identify the format of the archive, so we don't
     # mis-interpret its contents.
     # YYYYMMDDHHMM
-    __PickleFormat = '200907190858'
+    __PickleFormat = '202610151200'
 
     @classmethod
     def _AnonymousCategory (cls):
@@ -107,10 +113,34 @@ class NamespaceArchive (object):
         rv = cls.__NamespaceArchives.get(nsa.generationUID(), nsa)
         if rv == nsa:
             cls.__NamespaceArchives[rv.generationUID()] = rv
+        else:
+            # Already known by this generation UID; the generation UID is all
+            # we needed from this copy, so drop its open archive data now
+            # instead of holding it until the instance is collected.
+            nsa.__releaseArchiveData()
         rv._readToStage(stage)
         return rv
 
-    __ArchivePattern_re = re.compile('\.wxs$')
+    # Suffix identifying namespace archive files
+    __ArchiveSuffix = '.wxs'
+
+    # The archive path and archive file signature of the most recent scan by
+    # PreLoadArchives.  A rescan that finds the same files, unmodified, in
+    # the same path reuses the results of that scan.
+    __LastScan = None
+
+    @classmethod
+    def __ScanSignature (cls, candidate_files):
+        """Return a value that changes if any of the candidate archive files
+        is added, removed, or rewritten."""
+        signature = set()
+        for afn in candidate_files:
+            try:
+                st = os.stat(afn)
+            except OSError:
+                continue
+            signature.add((afn, st.st_mtime, st.st_size))
+        return frozenset(signature)
 
     @classmethod
     def PreLoadArchives (cls, archive_path=None, reset=False):
@@ -123,9 +153,10 @@ class NamespaceArchive (object):
         namespace archives can be found.  The entries are separated by
         os.pathsep, which is a colon on POSIX platforms and a semi-colon on
         Windows.  See L{PathEnvironmentVariable}.  Defaults to
-        L{GetArchivePath()}.  If not defaulted, C{reset} will be forced to
-        C{True}.  For any directory in the path, all files ending with
-        C{.wxs} are examined.
+        L{GetArchivePath()}.  If not defaulted, the path is re-scanned;
+        archives are re-validated only if this is not the path most recently
+        scanned or its archive files have changed since.  For any directory
+        in the path, all files ending with C{.wxs} are examined.
 
         @keyword reset: If C{False} (default), the most recently read set of
         archives is returned; if C{True}, the archive path is re-scanned and the
@@ -134,8 +165,8 @@ class NamespaceArchive (object):
 
         from pyxb.namespace import builtin
 
-        reset = reset or (archive_path is not None) or (cls.__NamespaceArchives is None)
-        if reset:
+        rescan = reset or (archive_path is not None) or (cls.__NamespaceArchives is None)
+        if rescan:
             # Get a list of pre-existing archives, initializing the map if
             # this is the first time through.
             if cls.__NamespaceArchives is None:
@@ -146,12 +177,19 @@ class NamespaceArchive (object):
             # Ensure we have an archive path.  If not, don't do anything.
             if archive_path is None:
                 archive_path = GetArchivePath()
+            last_scan = cls.__LastScan
+            cls.__LastScan = None
             if archive_path is not None:
 
                 # Get archive instances for everything in the archive path
-                candidate_files = pyxb.utils.utility.GetMatchingFiles(archive_path, cls.__ArchivePattern_re,
+                candidate_files = pyxb.utils.utility.GetMatchingFiles(archive_path, cls.__ArchiveSuffix,
                                                                       default_path_wildcard='+', default_path=GetArchivePath(),
                                                                       prefix_pattern='&', prefix_substituend=DefaultArchivePrefix)
+                this_scan = (archive_path, cls.__ScanSignature(candidate_files))
+                if (not reset) and (this_scan == last_scan):
+                    cls.__LastScan = last_scan
+                    return
+                cls.__LastScan = this_scan
                 for afn in candidate_files:
                     try:
                         nsa = cls.__GetArchiveInstance(afn, stage=cls._STAGE_readModules)
@@ -288,7 +326,7 @@ class NamespaceArchive (object):
             self.__isLoadable = loadable
             if self.__isLoadable:
                 if stage is None:
-                    stage = self._STAGE_moduleRecords
+                    stage = self._STAGE_readModules
                 self._readToStage(stage)
         else:
             pass
@@ -309,9 +347,7 @@ class NamespaceArchive (object):
     __namespaces = None
 
     def __createPickler (self, output):
-        if isinstance(output, six.string_types):
-            output = open(output, 'wb')
-        pickler = pickle.Pickler(output, -1)
+        pickler = pickle.Pickler(output, PickleProtocol)
 
         # The format of the archive
         pickler.dump(NamespaceArchive.__PickleFormat)
@@ -322,8 +358,47 @@ class NamespaceArchive (object):
 
         return pickler
 
+    # Buffer size used when an archive must be unpickled from the file
+    # rather than from a memory map.  Large enough that the unpickler's
+    # small reads are nearly always satisfied without a system call.
+    __ReadBufferSize = 1 << 20
+
+    # Archives no larger than this are read into memory in a single call
+    # rather than memory-mapped, since for small files setting up the map
+    # costs more than the read.
+    __SlurpSizeLimit = 1 << 16
+
+    def __openArchiveData (self):
+        """Return a readable file-like object holding the archive contents.
+
+        Small archives are read whole into memory.  Larger ones are
+        memory-mapped where possible, which avoids the buffered-I/O overhead
+        of unpickling directly from a file."""
+        archive_file = io.open(self.__archivePath, 'rb', buffering=0)
+        if os.fstat(archive_file.fileno()).st_size <= self.__SlurpSizeLimit:
+            try:
+                return io.BytesIO(archive_file.readall())
+            finally:
+                archive_file.close()
+        try:
+            archive_data = mmap.mmap(archive_file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (ValueError, EnvironmentError):
+            # Files on some special filesystems cannot be mapped; read
+            # those through a generously buffered reader.
+            return io.BufferedReader(archive_file, self.__ReadBufferSize)
+        archive_file.close()
+        return archive_data
+
+    def __releaseArchiveData (self):
+        self.__unpickler = None
+        if self.__archiveData is not None:
+            self.__archiveData.close()
+            self.__archiveData = None
+    __archiveData = None
+
     def __createUnpickler (self):
-        unpickler = pickle.Unpickler(open(self.__archivePath, 'rb'))
+        self.__archiveData = self.__openArchiveData()
+        unpickler = pickle.Unpickler(self.__archiveData)
 
         fmt = unpickler.load()
         if self.__PickleFormat != fmt:
@@ -387,23 +462,25 @@ class NamespaceArchive (object):
                 else:
                     _log.info('Have required base data %s', xmr)
 
+            category_map = ns._categoryMap()
             for origin in mr.origins():
                 for (cat, names) in six.iteritems(origin.categoryMembers()):
-                    if not (cat in ns.categories()):
+                    named_objects = category_map.get(cat)
+                    if named_objects is None:
                         continue
-                    cross_objects = names.intersection(six.iterkeys(ns.categoryMap(cat)))
+                    cross_objects = names.intersection(six.iterkeys(named_objects))
                     if 0 < len(cross_objects):
                         raise pyxb.NamespaceArchiveError('Archive %s namespace %s module %s origin %s archive/active conflict on category %s: %s' % (self.__archivePath, ns, mr, origin, cat, " ".join(cross_objects)))
                     _log.info('%s no conflicts on %d names', cat, len(names))
 
     def __readComponentSet (self, unpickler):
         self.__validatePrerequisites(self._STAGE_readComponents)
-        for n in range(len(self.__moduleRecords)):
-            ns = unpickler.load()
+        component_sets = unpickler.load()
+        assert len(component_sets) == len(self.__moduleRecords)
+        for (ns, objects) in component_sets:
             mr = ns.lookupModuleRecordByUID(self.generationUID())
             assert mr in self.__moduleRecords
             assert not mr.isIncorporated()
-            objects = unpickler.load()
             mr._loadCategoryObjects(objects)
 
     __unpickler = None
@@ -429,12 +506,12 @@ class NamespaceArchive (object):
                     assert self.__unpickler is not None
                     self.__stage = self._STAGE_readComponents
                     self.__readComponentSet(self.__unpickler)
-                    self.__unpickler = None
+                    self.__releaseArchiveData()
                     continue
                 raise pyxb.LogicError('Too many stages (at %s, want %s)' % (self.__stage, stage))
         except:
             self.__stage = None
-            self.__unpickler = None
+            self.__releaseArchiveData()
             raise
 
     def readNamespaces (self):
@@ -446,12 +523,16 @@ class NamespaceArchive (object):
         """Store the namespaces into the archive.
 
         @param output: An instance substitutable for a writable file, or the
-        name of a file to write to.
+        name of a file to write to.  A file opened from a name is closed
+        before this returns.
         """
         import sys
 
+        if isinstance(output, six.string_types):
+            with open(output, 'wb') as output_file:
+                return self.writeNamespaces(output_file)
+
         assert NamespaceArchive.__PicklingArchive is None
-        NamespaceArchive.__PicklingArchive = self
         assert self.__moduleRecords is not None
 
         # Recalculate the record/object associations: we didn't assign
@@ -460,9 +541,10 @@ class NamespaceArchive (object):
         for mr in self.__moduleRecords:
             mr.namespace()._associateOrigins(mr)
 
+        # See http://bugs.python.org/issue3338
+        recursion_limit = sys.getrecursionlimit()
+        NamespaceArchive.__PicklingArchive = self
         try:
-            # See http://bugs.python.org/issue3338
-            recursion_limit = sys.getrecursionlimit()
             sys.setrecursionlimit(10 * recursion_limit)
 
             pickler = self.__createPickler(output)
@@ -470,12 +552,12 @@ class NamespaceArchive (object):
             assert isinstance(self.__moduleRecords, set)
             pickler.dump(self.__moduleRecords)
 
-            for mr in self.__moduleRecords:
-                pickler.dump(mr.namespace())
-                pickler.dump(mr.categoryObjects())
+            # The components of all modules go out as a single pickle, so
+            # they are read back with one load.
+            pickler.dump([ (_mr.namespace(), _mr._archivedCategoryObjects()) for _mr in self.__moduleRecords ])
         finally:
             sys.setrecursionlimit(recursion_limit)
-        NamespaceArchive.__PicklingArchive = None
+            NamespaceArchive.__PicklingArchive = None
 
     def __str__ (self):
         archive_path = self.__archivePath
@@ -765,14 +847,30 @@ class ModuleRecord (pyxb.utils.utility.PrivateTransient_mixin):
     def _addCategoryObject (self, category, name, obj):
         obj._prepareForArchive(self)
         self.__categoryObjects.setdefault(category, {})[name] = obj
+    def _archivedCategoryObjects (self):
+        """Return the category objects in the form stored in an archive.
+
+        Each category is represented by a tuple C{(category, names,
+        objects)}, where C{names} and C{objects} are parallel sequences.
+        Keeping the names, which are plain strings, separate from the
+        component graph lets L{_loadCategoryObjects} populate an empty
+        category map in a single update."""
+        rv = []
+        for (cat, obj_map) in six.iteritems(self.__categoryObjects):
+            names = tuple(obj_map)
+            rv.append( (cat, names, tuple(obj_map[_n] for _n in names)) )
+        return rv
     def _loadCategoryObjects (self, category_objects):
         assert self.__categoryObjects is None
         assert not self.__constructedLocally
         ns = self.namespace()
-        ns.configureCategories(six.iterkeys(category_objects))
-        for (cat, obj_map) in six.iteritems(category_objects):
+        ns.configureCategories([ _co[0] for _co in category_objects ])
+        for (cat, names, objects) in category_objects:
             current_map = ns.categoryMap(cat)
-            for (local_name, component) in six.iteritems(obj_map):
+            if 0 == len(current_map):
+                current_map.update(zip(names, objects))
+                continue
+            for (local_name, component) in zip(names, objects):
                 existing_component = current_map.get(local_name)
                 if existing_component is None:
                     current_map[local_name] = component
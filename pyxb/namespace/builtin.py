@@ -136,6 +136,9 @@ class _XMLSchema_instance (Namespace):
             did_replace = True
         return (did_replace, type_class)
 
+    # Names of the attribute declarations built into this namespace.
+    __AttributeNames = ( 'type', 'nil', 'schemaLocation', 'noNamespaceSchemaLocation' )
+
     def _defineBuiltins_ox (self, structures_module):
         """Ensure this namespace is ready for use.
 
@@ -144,10 +147,10 @@ class _XMLSchema_instance (Namespace):
 
         assert structures_module is not None
         schema = structures_module.Schema(namespace_context=self.initialNamespaceContext(), schema_location="URN:noLocation:PyXB:xsi", generation_uid=BuiltInObjectUID, _bypass_preload=True)
-        schema._addNamedComponent(structures_module.AttributeDeclaration.CreateBaseInstance('type', schema))
-        schema._addNamedComponent(structures_module.AttributeDeclaration.CreateBaseInstance('nil', schema))
-        schema._addNamedComponent(structures_module.AttributeDeclaration.CreateBaseInstance('schemaLocation', schema))
-        schema._addNamedComponent(structures_module.AttributeDeclaration.CreateBaseInstance('noNamespaceSchemaLocation', schema))
+        add_named_component = schema._addNamedComponent
+        create_attribute_declaration = structures_module.AttributeDeclaration.CreateBaseInstance
+        for name in self.__AttributeNames:
+            add_named_component(create_attribute_declaration(name, schema))
         return self
 
 class _XML (Namespace):
@@ -296,8 +299,10 @@ def _InitializeBuiltinNamespaces (structures_module):
     global __InitializedBuiltinNamespaces
     if not __InitializedBuiltinNamespaces:
         __InitializedBuiltinNamespaces = True
-        [ _ns._defineBuiltins(structures_module) for _ns in BuiltInNamespaces ]
+        for _ns in BuiltInNamespaces:
+            _ns._defineBuiltins(structures_module)
 
-# Set up the prefixes for xml, xmlns, etc.
-_UndeclaredNamespaceMap = { }
-[ _UndeclaredNamespaceMap.setdefault(_ns.boundPrefix(), _ns) for _ns in BuiltInNamespaces if _ns.isUndeclaredNamespace() ]
+# Set up the prefixes for xml, xmlns, etc.  This map is shared as the initial
+# in-scope map of every NamespaceContext, which copies it before making any
+# change; it must not be modified in place.
+_UndeclaredNamespaceMap = dict((_ns.boundPrefix(), _ns) for _ns in BuiltInNamespaces if _ns.isUndeclaredNamespace())
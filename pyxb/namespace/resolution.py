@@ -16,6 +16,7 @@
 """Classes and global objects related to resolving U{XML
 Namespaces<http://www.w3.org/TR/2006/REC-xml-names-20060816/index.html>}."""
 
+import collections
 import logging
 import pyxb
 import pyxb.utils.utility
@@ -71,7 +72,9 @@ class _Resolvable_mixin (pyxb.cscRoot):
         """
         if (why is not None) and self._TraceResolution:
             _log.info('Resolution delayed for %s: %s\n\tDepends on: %s', self, why, depends_on)
-        self._namespaceContext().queueForResolution(self, depends_on)
+        # Bypass NamespaceContext.queueForResolution, which only forwards to
+        # the target namespace after repeating the type check done there.
+        self._namespaceContext().targetNamespace().queueForResolution(self, depends_on)
 
 class _NamespaceResolution_mixin (pyxb.cscRoot):
     """Mix-in that aggregates those aspects of XMLNamespaces relevant to
@@ -86,8 +89,9 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
     # with this namespace as target.
     __referencedNamespaces = None
 
-    # A list of Namespace._Resolvable_mixin instances that have yet to be
-    # resolved.
+    # An OrderedDict used as an insertion-ordered set of
+    # Namespace._Resolvable_mixin instances that have yet to be resolved.
+    # Only the keys are significant.
     __unresolvedComponents = None
 
     # A map from Namespace._Resolvable_mixin instances in
@@ -100,7 +104,7 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
 
         This one handles component-resolution--related data."""
         getattr(super(_NamespaceResolution_mixin, self), '_reset', lambda *args, **kw: None)()
-        self.__unresolvedComponents = []
+        self.__unresolvedComponents = collections.OrderedDict()
         self.__unresolvedDependents = {}
         self.__importedNamespaces = set()
         self.__referencedNamespaces = set()
@@ -161,7 +165,7 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
         assert isinstance(resolvable, _Resolvable_mixin)
         if not resolvable.isResolved():
             assert depends_on is None or isinstance(depends_on, _Resolvable_mixin)
-            self.__unresolvedComponents.append(resolvable)
+            self.__unresolvedComponents[resolvable] = None
             if depends_on is not None and not depends_on.isResolved():
                 from pyxb.xmlschema import structures
                 assert isinstance(depends_on, _Resolvable_mixin)
@@ -176,20 +180,17 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
     def _replaceComponent_csc (self, existing_def, replacement_def):
         """Replace a component definition if present in the list of unresolved components.
         """
-        try:
-            index = self.__unresolvedComponents.index(existing_def)
-            if (replacement_def is None) or (replacement_def in self.__unresolvedComponents):
-                del self.__unresolvedComponents[index]
-            else:
+        if (self.__unresolvedComponents is not None) and (existing_def in self.__unresolvedComponents):
+            del self.__unresolvedComponents[existing_def]
+            if replacement_def is not None:
+                # The replacement goes to the end of the queue; resolution
+                # order among queued components is not significant.
                 assert isinstance(replacement_def, _Resolvable_mixin)
-                self.__unresolvedComponents[index] = replacement_def
+                self.__unresolvedComponents[replacement_def] = None
             # Rather than assume the replacement depends on the same
             # resolvables as the original, just wipe the dependency record:
             # it'll get recomputed later if it's still important.
-            if existing_def in self.__unresolvedDependents:
-                del self.__unresolvedDependents[existing_def]
-        except ValueError:
-            pass
+            self.__unresolvedDependents.pop(existing_def, None)
         return getattr(super(_NamespaceResolution_mixin, self), '_replaceComponent_csc', lambda *args, **kw: replacement_def)(existing_def, replacement_def)
 
     def resolveDefinitions (self, allow_unresolved=False):
@@ -214,9 +215,9 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
             # Save the list of unresolved objects, reset the list to capture
             # any new objects defined during resolution, and attempt the
             # resolution for everything that isn't resolved.
-            unresolved = self.__unresolvedComponents
+            unresolved = list(self.__unresolvedComponents)
 
-            self.__unresolvedComponents = []
+            self.__unresolvedComponents.clear()
             self.__unresolvedDependents = {}
             for resolvable in unresolved:
                 # Attempt the resolution.
@@ -231,7 +232,7 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
                 # clones.
                 if (resolvable.isResolved() and (resolvable._clones() is not None)):
                     assert False
-            if self.__unresolvedComponents == unresolved:
+            if (len(self.__unresolvedComponents) == len(unresolved)) and (set(self.__unresolvedComponents) == set(unresolved)):
                 if allow_unresolved:
                     return False
                 # This only happens if we didn't code things right, or the
@@ -261,7 +262,8 @@ class _NamespaceResolution_mixin (pyxb.cscRoot):
         return True
 
     def _unresolvedComponents (self):
-        """Returns a reference to the list of unresolved components."""
+        """Returns a reference to the ordered collection of unresolved
+        components.  Only the keys of the returned map are significant."""
         return self.__unresolvedComponents
 
     def _unresolvedDependents (self):
@@ -279,38 +281,26 @@ def ResolveSiblingNamespaces (sibling_namespaces):
         ns.configureCategories([archive.NamespaceArchive._AnonymousCategory()])
         ns.validateComponentModel()
 
-    def __keyForCompare (dependency_map):
+    def __dependencyRank (dependency_map):
         """Sort namespaces so dependencies get resolved first.
 
-        Uses the trick underlying functools.cmp_to_key(), but optimized for
-        this special case.  The dependency map is incorporated into the class
-        definition by scope.
+        Each namespace is ranked by the number of namespaces it depends on,
+        directly or indirectly.  If C{ns} depends on C{dns}, everything
+        C{dns} depends on is also a dependency of C{ns}, so C{ns} never ranks
+        below C{dns}; mutually dependent namespaces share a rank.  The rank is
+        computed once per namespace rather than on every comparison.
         """
-        class K (object):
-            def __init__ (self, ns, *args):
-                self.__ns = ns
-
-            # self compares less than other if self.ns is in the dependency set
-            # of other.ns but not vice-versa.
-            def __lt__ (self, other):
-                return ((self.__ns in dependency_map.get(other.__ns, set())) \
-                            and not (other.__ns in dependency_map.get(self.__ns, set())))
-
-            # self compares equal to other if their namespaces are either
-            # mutually dependent or independent.
-            def __eq__ (self, other):
-                return (self.__ns in dependency_map.get(other.__ns, set())) == (other.__ns in dependency_map.get(self.__ns, set()))
-
-            # All other order metrics are derived.
-            def __ne__ (self, other):
-                return not self.__eq__(other)
-            def __le__ (self, other):
-                return self.__lt__(other) or self.__eq__(other)
-            def __gt__ (self, other):
-                return other.__lt__(self.__ns)
-            def __ge__ (self, other):
-                return other.__lt__(self.__ns) or self.__eq__(other)
-        return K
+        rank = {}
+        for ns in dependency_map:
+            closure = set()
+            pending = list(dependency_map[ns])
+            while pending:
+                dns = pending.pop()
+                if not (dns in closure):
+                    closure.add(dns)
+                    pending.extend(dependency_map.get(dns, ()))
+            rank[ns] = len(closure)
+        return lambda _ns: rank.get(_ns, 0)
 
     need_resolved_set = set(sibling_namespaces)
     dependency_map = {}
@@ -318,7 +308,7 @@ def ResolveSiblingNamespaces (sibling_namespaces):
     while need_resolved_set:
         need_resolved_list = list(need_resolved_set)
         if dependency_map:
-            need_resolved_list.sort(key=__keyForCompare(dependency_map))
+            need_resolved_list.sort(key=__dependencyRank(dependency_map))
         need_resolved_set = set()
         dependency_map = {}
         for ns in need_resolved_list:
@@ -331,7 +321,8 @@ def ResolveSiblingNamespaces (sibling_namespaces):
                         dns = dc.expandedName().namespace()
                         if dns != ns:
                             deps.add(dns)
-                _log.info('Holding incomplete resolution %s depending on: ', ns.uri(), six.u(' ; ').join([ six.text_type(_dns) for _dns in deps ]))
+                if _log.isEnabledFor(logging.INFO):
+                    _log.info('Holding incomplete resolution %s depending on: %s', ns.uri(), six.u(' ; ').join([ six.text_type(_dns) for _dns in deps ]))
                 need_resolved_set.add(ns)
         # Exception termination check: if we have the same set of incompletely
         # resolved namespaces, and each has the same number of unresolved
@@ -351,6 +342,14 @@ class NamespaceContext (object):
     """Records information associated with namespaces at a DOM node.
     """
 
+    # A context is created for, and stays attached to, every element of a
+    # DOM walked with this class, so instances do without a __dict__.
+    # Every slot is assigned in __init__.
+    __slots__ = ( '__defaultNamespace', '__targetNamespace', '__fallbackToTargetNamespace',
+                  '__pendingReferencedNamespaces', '__inScopeNamespaces', '__inScopePrefixes',
+                  '__initialScopeNamespaces', '__initialScopePrefixes',
+                  '__mutableInScopeNamespaces', '__namespacePrefixCounter' )
+
     def __str__ (self):
         rv = [ six.u('NamespaceContext ') ]
         if self.defaultNamespace() is not None:
@@ -401,14 +400,9 @@ class NamespaceContext (object):
     def _TargetNamespaceAttribute (cls, expanded_name):
         return cls.__TargetNamespaceAttributes.get(expanded_name)
 
-    # Support for holding onto referenced namespaces until we have a target
-    # namespace to give them to.
-    __pendingReferencedNamespaces = None
-
     def defaultNamespace (self):
         """The default namespace in effect at this node.  E.g., C{xmlns="URN:default"}."""
         return self.__defaultNamespace
-    __defaultNamespace = None
 
     def setDefaultNamespace (self, default_namespace):
         """Set the default namespace for the generated document.
@@ -430,31 +424,17 @@ class NamespaceContext (object):
             raise pyxb.UsageError('Default namespace must not be an absent namespace')
         self.__defaultNamespace = default_namespace
 
-    # If C{True}, this context is within a schema that has no target
-    # namespace, and we should use the target namespace as a fallback if no
-    # default namespace is available and no namespace prefix appears on a
-    # QName.  This situation arises when a top-level schema has an absent
-    # target namespace, or when a schema with an absent target namespace is
-    # being included into a schema with a non-absent target namespace.
-    __fallbackToTargetNamespace = False
-
     def targetNamespace (self):
         """The target namespace in effect at this node.  Usually from the
         C{targetNamespace} attribute.  If no namespace is specified for the
         schema, an absent namespace was assigned upon creation and will be
         returned."""
         return self.__targetNamespace
-    __targetNamespace = None
 
     def inScopeNamespaces (self):
         """Map from prefix strings to L{Namespace} instances associated with those
         prefixes.  The prefix C{None} identifies the default namespace."""
         return self.__inScopeNamespaces
-    __inScopeNamespaces = None
-
-    """Map from L{Namespace} instances to sets of prefix strings associated
-    with the namespace.  The default namespace is not represented."""
-    __inScopePrefixes = None
 
     def __removePrefixMap (self, pfx):
         ns = self.__inScopeNamespaces.pop(pfx, None)
@@ -479,10 +459,6 @@ class NamespaceContext (object):
     __InitialScopeNamespaces = None
     # Class-scope initial map from namespace to prefix(es)
     __InitialScopePrefixes = None
-    # Instance-specific initial map from prefix to namespace
-    __initialScopeNamespaces = None
-    # Instance-specific initial map from namespace to prefix(es)
-    __initialScopePrefixes = None
 
 
     @classmethod
@@ -523,9 +499,6 @@ class NamespaceContext (object):
     def setNodeContext (self, node):
         node.__namespaceContext = self
 
-    # Integer counter to help generate unique namespace prefixes
-    __namespacePrefixCounter = None
-
     def declareNamespace (self, namespace, prefix=None, add_to_map=False):
         """Record the given namespace as one to be used in this document.
 
@@ -621,8 +594,9 @@ class NamespaceContext (object):
             else:
                 self.__targetNamespace = utility.NamespaceForURI(tns_uri, create_if_missing=True)
         if self.__pendingReferencedNamespaces is not None:
-            [ self.__targetNamespace._referenceNamespace(_ns) for _ns in self.__pendingReferencedNamespaces ]
-            self.__pendingReferencedNamespace = None
+            for ns in self.__pendingReferencedNamespaces:
+                self.__targetNamespace._referenceNamespace(ns)
+            self.__pendingReferencedNamespaces = None
         assert self.__targetNamespace is not None
         if (not self.__fallbackToTargetNamespace) and self.__targetNamespace.isAbsentNamespace():
             self.__fallbackToTargetNamespace = True
@@ -697,11 +671,26 @@ class NamespaceContext (object):
 
         self.__defaultNamespace = default_namespace
         self.__targetNamespace = target_namespace
+        # If True, this context is within a schema that has no target
+        # namespace, and we should use the target namespace as a fallback if
+        # no default namespace is available and no namespace prefix appears
+        # on a QName.  This situation arises when a top-level schema has an
+        # absent target namespace, or when a schema with an absent target
+        # namespace is being included into a schema with a non-absent target
+        # namespace.
+        self.__fallbackToTargetNamespace = False
+        # Support for holding onto referenced namespaces until we have a
+        # target namespace to give them to.
+        self.__pendingReferencedNamespaces = None
         if self.__InitialScopeNamespaces is None:
             self.__BuildInitialPrefixMap()
+        # Map from prefix to namespace, and from namespace to the set of
+        # prefixes associated with it.  The default namespace is not
+        # represented in the latter.
         self.__inScopeNamespaces = self.__InitialScopeNamespaces
         self.__inScopePrefixes = self.__InitialScopePrefixes
         self.__mutableInScopeNamespaces = False
+        # Integer counter to help generate unique namespace prefixes
         self.__namespacePrefixCounter = 0
 
         if parent_context is not None:
@@ -729,22 +718,39 @@ class NamespaceContext (object):
             self.__pendingReferencedNamespaces = set()
         attribute_map = {}
         if dom_node is not None:
+            ExpandedName = pyxb.namespace.ExpandedName
             if expanded_name is None:
-                expanded_name = pyxb.namespace.ExpandedName(dom_node)
-            for ai in range(dom_node.attributes.length):
-                attr = dom_node.attributes.item(ai)
-                if builtin.XMLNamespaces.uri() == attr.namespaceURI:
+                expanded_name = ExpandedName(dom_node)
+            # Hoist the invariant lookups out of the per-attribute loop.  The
+            # namespace URI is interned, so attribute URIs that were interned
+            # on input match it by identity.
+            xmlns_uri = builtin.XMLNamespaces.uri()
+            registered_namespace = pyxb.namespace.Namespace._NamespaceForURI
+            attributes = dom_node.attributes
+            attribute_item = attributes.item
+            for ai in range(attributes.length):
+                attr = attribute_item(ai)
+                attr_uri = attr.namespaceURI
+                if (xmlns_uri is attr_uri) or (xmlns_uri == attr_uri):
                     prefix = attr.localName
                     if 'xmlns' == prefix:
                         prefix = None
                     self.processXMLNS(prefix, attr.value)
                 else:
-                    if attr.namespaceURI is not None:
-                        uri = utility.NamespaceForURI(attr.namespaceURI, create_if_missing=True)
-                        key = pyxb.namespace.ExpandedName(uri, attr.localName)
-                    else:
-                        key = pyxb.namespace.ExpandedName(None, attr.localName)
-                    attribute_map[key] = attr.value
+                    ns = None
+                    if attr_uri is not None:
+                        # Equivalent to utility.NamespaceForURI(attr_uri,
+                        # create_if_missing=True); the DOM never supplies an
+                        # empty namespace URI.
+                        ns = registered_namespace(attr_uri)
+                        if ns is None:
+                            ns = pyxb.namespace.Namespace(attr_uri)
+                    attribute_map[ExpandedName(ns, attr.localName)] = attr.value
+            # Any namespace declarations on this node have been applied.
+            # Clear the flag so the maps may be shared with child contexts
+            # without copying: whichever context next modifies them will
+            # first make its own copy.
+            self.__mutableInScopeNamespaces = False
 
         if finalize_target_namespace:
             tns_uri = None
@@ -759,9 +765,15 @@ class NamespaceContext (object):
         if (dom_node is not None) and recurse:
             from xml.dom import Node
             assert Node.ELEMENT_NODE == dom_node.nodeType
-            for cn in dom_node.childNodes:
-                if Node.ELEMENT_NODE == cn.nodeType:
-                    NamespaceContext(dom_node=cn, parent_context=self, recurse=True)
+            # Visit the element descendants in document order using an
+            # explicit stack of (node, parent context) pairs, rather than a
+            # recursive constructor call per element.
+            ELEMENT_NODE = Node.ELEMENT_NODE
+            pending = [ (_cn, self) for _cn in reversed(dom_node.childNodes) if ELEMENT_NODE == _cn.nodeType ]
+            while pending:
+                (node, parent) = pending.pop()
+                context = NamespaceContext(dom_node=node, parent_context=parent, recurse=False)
+                pending.extend([ (_cn, context) for _cn in reversed(node.childNodes) if ELEMENT_NODE == _cn.nodeType ])
 
     def interpretQName (self, name, namespace=None, default_no_namespace=False):
         """Convert the provided name into an L{ExpandedName}, i.e. a tuple of
@@ -788,21 +800,22 @@ class NamespaceContext (object):
         if isinstance(name, pyxb.namespace.ExpandedName):
             return name
         assert isinstance(name, six.string_types)
-        if 0 <= name.find(':'):
-            (prefix, local_name) = name.split(':', 1)
-            assert self.inScopeNamespaces() is not None
-            namespace = self.inScopeNamespaces().get(prefix)
+        # A single scan both detects and splits off any prefix
+        (prefix, colon, local_name) = name.partition(':')
+        if colon:
+            assert self.__inScopeNamespaces is not None
+            namespace = self.__inScopeNamespaces.get(prefix)
             if namespace is None:
                 raise pyxb.QNameResolutionError('No namespace declaration for prefix', name, self)
         else:
             local_name = name
             # Context default supersedes caller-provided namespace
-            if self.defaultNamespace() is not None:
-                namespace = self.defaultNamespace()
+            if self.__defaultNamespace is not None:
+                namespace = self.__defaultNamespace
             # If there's no default namespace, but there is a fallback
             # namespace, use that instead.
             if (namespace is None) and self.__fallbackToTargetNamespace:
-                namespace = self.targetNamespace()
+                namespace = self.__targetNamespace
             if (namespace is None) and not default_no_namespace:
                 raise pyxb.QNameResolutionError('NCName with no fallback/default namespace cannot be resolved', name, self)
         return pyxb.namespace.ExpandedName(namespace, local_name)
@@ -659,28 +659,35 @@ class Graph:
         a partial order on the nodes, without being as constraining as
         L{sccOrder}.
 
-        @return: a list of the root sets."""
-        order = []
-        nodes = set(self.__nodes)
-        edge_map = {}
+        @return: a list of the root sets, or C{None} if the graph
+        contains a dependency cycle."""
+        # Kahn-style topological sort performed one level at a time:
+        # count the unsatisfied targets of each node, and note for
+        # each target which nodes are waiting on it.  Each root set is
+        # then the set of nodes whose count dropped to zero while
+        # processing the previous set.
+        pending = {}
+        dependents = {}
         for (d, srcs) in six.iteritems(self.__edgeMap):
-            edge_map[d] = srcs.copy()
-        while nodes:
-            freeset = set()
-            for n in nodes:
-                if not (n in edge_map):
-                    freeset.add(n)
-            if 0 == len(freeset):
-                _log.error('dependency cycle in named components')
-                return None
+            pending[d] = len(srcs)
+            for s in srcs:
+                dependents.setdefault(s, []).append(d)
+        order = []
+        remaining = len(self.__nodes)
+        freeset = set([ _n for _n in self.__nodes if not pending.get(_n) ])
+        while freeset:
             order.append(freeset)
-            nodes.difference_update(freeset)
-            new_edge_map = {}
-            for (d, srcs) in six.iteritems(edge_map):
-                srcs.difference_update(freeset)
-                if 0 != len(srcs):
-                    new_edge_map[d] = srcs
-            edge_map = new_edge_map
+            remaining -= len(freeset)
+            next_freeset = set()
+            for n in freeset:
+                for d in dependents.get(n, ()):
+                    pending[d] -= 1
+                    if 0 == pending[d]:
+                        next_freeset.add(d)
+            freeset = next_freeset
+        if 0 < remaining:
+            _log.error('dependency cycle in named components')
+            return None
         return order
 
 LocationPrefixRewriteMap_ = { }
@@ -1091,20 +1098,23 @@ class PrivateTransient_mixin (pyxb.cscRoot):
     # transient members are cached.
     __Attribute = '__PrivateTransient'
 
+    # Map from class to the aggregate set of mangled member names that
+    # are transient in its instances.
+    __TransientNames = { }
+
     def __getstate__ (self):
-        state = self.__dict__.copy()
-        # Note that the aggregate set is stored in a class variable
-        # with a slightly different name than the class-level set.
-        attr = '_%s%s_' % (self.__class__.__name__, self.__Attribute)
-        skipped = getattr(self.__class__, attr, None)
+        cls = type(self)
+        skipped = PrivateTransient_mixin.__TransientNames.get(cls)
         if skipped is None:
+            suffix = self.__Attribute
             skipped = set()
-            for cl in self.__class__.mro():
+            for cl in cls.mro():
                 for (k, v) in six.iteritems(cl.__dict__):
-                    if k.endswith(self.__Attribute):
-                        cl2 = k[:-len(self.__Attribute)]
+                    if k.endswith(suffix):
+                        cl2 = k[:-len(suffix)]
                         skipped.update([ '%s__%s' % (cl2, _n) for _n in v ])
-            setattr(self.__class__, attr, skipped)
+            skipped = PrivateTransient_mixin.__TransientNames[cls] = frozenset(skipped)
+        state = self.__dict__.copy()
         for k in skipped:
             if state.get(k) is not None:
                 del state[k]
@@ -1146,8 +1156,10 @@ def GetMatchingFiles (path, pattern=None, default_path_wildcard=None, default_pa
     recursively.
 
     @keyword pattern: Optional regular expression object used to
-    determine whether a given directory entry should be returned.  If
-    left as C{None}, all directory entries will be returned.
+    determine whether a given directory entry should be returned.  A
+    string is taken as a required suffix, which is cheaper to test than
+    the equivalent expression.  If left as C{None}, all directory
+    entries will be returned.
 
     @keyword default_path_wildcard: An optional string which, if
     present as a single directory in the path, is replaced by the
@@ -1167,6 +1179,15 @@ def GetMatchingFiles (path, pattern=None, default_path_wildcard=None, default_pa
     area.
     """
     matching_files = []
+    # Bind the match predicate once rather than per directory entry.
+    if pattern is None:
+        matches = lambda _f: True
+    elif isinstance(pattern, six.string_types):
+        suffix = pattern
+        matches = lambda _f: _f.endswith(suffix)
+    else:
+        search = pattern.search
+        matches = lambda _f: search(_f) is not None
     path_set = path.split(os.pathsep)
     while 0 < len(path_set):
         path = path_set.pop(0)
@@ -1182,13 +1203,11 @@ def GetMatchingFiles (path, pattern=None, default_path_wildcard=None, default_pa
             recursive = True
             path = path[:-2]
         if os.path.isfile(path):
-            if (pattern is None) or (pattern.search(path) is not None):
+            if matches(path):
                 matching_files.append(path)
         else:
             for (root, dirs, files) in os.walk(path):
-                for f in files:
-                    if (pattern is None) or (pattern.search(f) is not None):
-                        matching_files.append(os.path.join(root, f))
+                matching_files.extend([ os.path.join(root, _f) for _f in files if matches(_f) ])
                 if not recursive:
                     break
     return matching_files
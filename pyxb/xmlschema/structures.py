@@ -56,6 +56,18 @@ _PastAddBuiltInTypes = False
 # Make it easier to check node names in the XMLSchema namespace
 from pyxb.namespace import XMLSchema as xsd
 
+# Fixed vocabularies of XMLSchema element local names, for use with
+# xsd.nodeIsNamed() on every candidate DOM node.
+_IdentityConstraintNodeNames = frozenset(('key', 'unique', 'keyref'))
+_IdentityConstraintFieldNodeNames = frozenset(('selector', 'field'))
+_ContentNodeNames = frozenset(('simpleContent', 'complexContent'))
+_GroupMemberNodeNames = frozenset(('all', 'choice', 'sequence'))
+_TypedefNodeNames = _GroupMemberNodeNames.union(('group',))
+_ParticleNodeNames = _TypedefNodeNames.union(('element', 'any'))
+_AttributeUseNodeNames = frozenset(('attributeGroup', 'attribute', 'anyAttribute'))
+_WildcardNodeNames = frozenset(('any', 'anyAttribute'))
+_EmptiableGroupNodeNames = frozenset(('all', 'sequence'))
+
 class _SchemaComponent_mixin (pyxb.namespace._ComponentDependency_mixin,
                               pyxb.namespace.archive._ArchivableObject_mixin,
                               pyxb.utils.utility.PrivateTransient_mixin,
@@ -738,7 +750,7 @@ class _NamedComponent_mixin (pyxb.utils.utility.PrivateTransient_mixin, pyxb.csc
             scope_ref = _PickledAnonymousReference.FromPickled(scope)
             if object_reference.namespace() != scope_ref.namespace():
                 scope_ref.validateComponentModel()
-                assert 'typeDefinition' in scope_ref.namespace().categories()
+                assert 'typeDefinition' in scope_ref.namespace()._categoryMap()
             scope_ctd = scope_ref.typeDefinition()
             if scope_ctd is None:
                 raise pyxb.SchemaValidationError('Unable to resolve local scope %s' % (scope_ref,))
@@ -1632,7 +1644,7 @@ class ElementDeclaration (_ParticleTree_mixin, _SchemaComponent_mixin, _NamedCom
 
         identity_constraints = []
         for cn in node.childNodes:
-            if (Node.ELEMENT_NODE == cn.nodeType) and xsd.nodeIsNamed(cn, 'key', 'unique', 'keyref'):
+            if (Node.ELEMENT_NODE == cn.nodeType) and xsd.nodeIsNamed(cn, _IdentityConstraintNodeNames):
                 identity_constraints.append(IdentityConstraintDefinition.CreateFromDOM(cn, **kw))
         rv.__identityConstraintDefinitions = identity_constraints
 
@@ -2314,13 +2326,13 @@ class ComplexTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb
         for cn in definition_node_list:
             if Node.ELEMENT_NODE != cn.nodeType:
                 continue
-            if xsd.nodeIsNamed(cn, 'simpleContent', 'complexContent'):
+            if xsd.nodeIsNamed(cn, _ContentNodeNames):
                 # Should have found the content node earlier.
                 raise pyxb.LogicError('Missed explicit wrapper in complexType content')
             if Particle.IsTypedefNode(cn):
                 typedef_node = cn
                 test_2_1_1 = False
-            if xsd.nodeIsNamed(cn, 'all', 'sequence') \
+            if xsd.nodeIsNamed(cn, _EmptiableGroupNodeNames) \
                     and (not domutils.HasNonAnnotationChild(cn)):
                 test_2_1_2 = True
             if xsd.nodeIsNamed(cn, 'choice') \
@@ -2462,7 +2474,7 @@ class ComplexTypeDefinition (_SchemaComponent_mixin, _NamedComponent_mixin, pyxb
             else:
                 # Not one of the wrappers; use implicit wrapper around
                 # the children
-                if not Particle.IsParticleNode(first_elt, 'attributeGroup', 'attribute', 'anyAttribute'):
+                if not Particle.IsParticleNode(first_elt, _AttributeUseNodeNames):
                     raise pyxb.SchemaValidationError('Unexpected element %s at root of complexType' % (first_elt.nodeName,))
             if have_content:
                 # Repeat the search to verify that only the one child is present.
@@ -2938,7 +2950,7 @@ class ModelGroup (_ParticleTree_mixin, _SchemaComponent_mixin, _Annotated_mixin)
                         location = ' at ' + str(cn._location());
                     else:
                         location = '';
-                    _log.warning('Particle %s%s discarded due to maxOccurs 0' % (particle, location))
+                    _log.warning('Particle %s%s discarded due to maxOccurs 0', particle, location)
                 else:
                     particles.append(particle)
             elif not xsd.nodeIsNamed(cn, 'annotation'):
@@ -2951,7 +2963,7 @@ class ModelGroup (_ParticleTree_mixin, _SchemaComponent_mixin, _Annotated_mixin)
 
     @classmethod
     def IsGroupMemberNode (cls, node):
-        return xsd.nodeIsNamed(node, 'all', 'choice', 'sequence')
+        return xsd.nodeIsNamed(node, _GroupMemberNodeNames)
 
     # aFS:MG
     def _adaptForScope (self, owner, ctd):
@@ -3245,11 +3257,13 @@ class Particle (_ParticleTree_mixin, _SchemaComponent_mixin, pyxb.namespace.reso
 
     @classmethod
     def IsTypedefNode (cls, node):
-        return xsd.nodeIsNamed(node, 'group', 'all', 'choice', 'sequence')
+        return xsd.nodeIsNamed(node, _TypedefNodeNames)
 
     @classmethod
     def IsParticleNode (cls, node, *others):
-        return xsd.nodeIsNamed(node, 'group', 'all', 'choice', 'sequence', 'element', 'any', *others)
+        if xsd.nodeIsNamed(node, _ParticleNodeNames):
+            return True
+        return (0 < len(others)) and xsd.nodeIsNamed(node, *others)
 
     def __str__ (self):
         #return 'PART{%s:%d,%s}' % (self.term(), self.minOccurs(), self.maxOccurs())
@@ -3428,7 +3442,7 @@ class Wildcard (_ParticleTree_mixin, _SchemaComponent_mixin, _Annotated_mixin):
     @classmethod
     def CreateFromDOM (cls, node, **kw):
         namespace_context = pyxb.namespace.NamespaceContext.GetNodeContext(node)
-        assert xsd.nodeIsNamed(node, 'any', 'anyAttribute')
+        assert xsd.nodeIsNamed(node, _WildcardNodeNames)
         nc = domutils.NodeAttribute(node, 'namespace')
         if nc is None:
             namespace_constraint = cls.NC_any
@@ -3538,7 +3552,7 @@ class IdentityConstraintDefinition (_SchemaComponent_mixin, _NamedComponent_mixi
             if (Node.ELEMENT_NODE != cn.nodeType):
                 continue
             an = None
-            if xsd.nodeIsNamed(cn, 'selector', 'field'):
+            if xsd.nodeIsNamed(cn, _IdentityConstraintFieldNodeNames):
                 an = domutils.LocateUniqueChild(cn, 'annotation')
             elif xsd.nodeIsNamed(cn, 'annotation'):
                 an = cn
@@ -0,0 +1,21 @@
+#! /bin/sh
+
+test_name=${0}
+
+fail () {
+  echo 1>&2 "${test_name} FAILED: ${@}"
+  exit 1
+}
+
+rm -rf archives staged *.pyc preload.py
+mkdir archives staged
+
+# Generate the archive outside the directory that the test scans; the test
+# moves it into place between scans.
+pyxbgen \
+  --schema-location=preload.xsd --module=preload \
+  --archive-to-file=staged/preload.wxs || fail cannot generate preload schema
+
+python tst_preload.py || fail archive added after scan
+
+echo "nspreload TESTS PASSED"
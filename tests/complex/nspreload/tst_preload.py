@@ -0,0 +1,24 @@
+# -*- coding: utf-8 -*-
+import logging
+if __name__ == '__main__':
+    logging.basicConfig()
+_log = logging.getLogger(__name__)
+import unittest
+import os.path
+import shutil
+import pyxb.namespace
+from pyxb.namespace.archive import NamespaceArchive
+
+class Test (unittest.TestCase):
+    def testArchiveAddedAfterScan (self):
+        uri = 'urn:preload'
+        NamespaceArchive.PreLoadArchives('archives')
+        self.assertEqual(None, pyxb.namespace.NamespaceForURI(uri))
+        shutil.copy(os.path.join('staged', 'preload.wxs'), 'archives')
+        NamespaceArchive.PreLoadArchives('archives')
+        ns = pyxb.namespace.NamespaceForURI(uri)
+        self.assertTrue(ns is not None)
+        self.assertEqual(1, len(ns.loadableFrom()))
+
+if '__main__' == __name__:
+    unittest.main()
@@ -7,6 +7,7 @@ import unittest
 import pyxb
 from pyxb.namespace import ExpandedName
 import xml.dom
+import xml.dom.minidom
 from pyxb.namespace import XMLSchema as xsd
 xsd.validateComponentModel()
 import pyxb.binding.datatypes as xsd_module
@@ -144,6 +145,13 @@ class TestExpandedName (unittest.TestCase):
         self.assertEqual(xsd_module.int, int_en.typeBinding())
         self.assertRaises(pyxb.NamespaceError, getattr, int_en, 'notACategory')
 
+class TestNamespaceForURI (unittest.TestCase):
+    def testAnyURI (self):
+        uri = xsd_module.anyURI('urn:test:namespace:anyURI')
+        ns = pyxb.namespace.NamespaceForURI(uri, create_if_missing=True)
+        self.assertEqual('urn:test:namespace:anyURI', ns.uri())
+        self.assertTrue(ns is pyxb.namespace.NamespaceForURI('urn:test:namespace:anyURI'))
+
 class TestCategories (unittest.TestCase):
     def testXSDCategories (self):
         # Need type and element bindings, along with all the component ones
@@ -162,5 +170,42 @@ class TestCategories (unittest.TestCase):
     def testNoCategory (self):
         self.assertRaises(pyxb.NamespaceError, pyxb.namespace.XMLSchema.categoryMap, 'not a category')
 
+    def testAccessors (self):
+        self.assertTrue(xsd.typeBindings() is xsd.categoryMap('typeBinding'))
+        self.assertTrue(xsd.typeDefinitions() is xsd.categoryMap('typeDefinition'))
+        self.assertFalse(hasattr(xsd, 'notACategorys'))
+        ns = pyxb.namespace.NamespaceForURI('urn:test:categoryAccessors', create_if_missing=True)
+        self.assertFalse(hasattr(ns, 'widgets'))
+        ns.configureCategories(['widget'])
+        self.assertTrue(ns.widgets() is ns.categoryMap('widget'))
+
+class TestNodeIsNamed (unittest.TestCase):
+    def testNodeIsNamed (self):
+        doc = xml.dom.minidom.parseString('<xs:sequence xmlns:xs="%s"/>' % (xsd.uri(),))
+        node = doc.documentElement
+        self.assertTrue(xsd.nodeIsNamed(node, 'sequence'))
+        self.assertTrue(xsd.nodeIsNamed(node, 'all', 'sequence'))
+        self.assertFalse(xsd.nodeIsNamed(node, 'all', 'choice'))
+        self.assertTrue(xsd.nodeIsNamed(node, frozenset(('all', 'sequence'))))
+        self.assertFalse(xsd.nodeIsNamed(node, frozenset(('all', 'choice'))))
+        ns = pyxb.namespace.NamespaceForURI('urn:test:nodeIsNamed', create_if_missing=True)
+        self.assertFalse(ns.nodeIsNamed(node, frozenset(('sequence',))))
+
+class TestBuiltinImport (unittest.TestCase):
+    def testLocationIgnored (self):
+        # The XML namespace is built in, so its schema location must not be
+        # retrieved.  This one does not exist.
+        schema_text = '''<xs:schema xmlns:xs="http://www.w3.org/2001/XMLSchema" xmlns:xml="http://www.w3.org/XML/1998/namespace">
+  <xs:import namespace="http://www.w3.org/XML/1998/namespace" schemaLocation="/nonexistent/xml.xsd"/>
+  <xs:element name="text">
+    <xs:complexType>
+      <xs:attribute ref="xml:lang"/>
+    </xs:complexType>
+  </xs:element>
+</xs:schema>'''
+        import pyxb.binding.generate
+        code = pyxb.binding.generate.GeneratePython(schema_text=schema_text)
+        self.assertTrue(0 <= code.find('lang'))
+
 if '__main__' == __name__:
     unittest.main()
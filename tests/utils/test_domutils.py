@@ -111,6 +111,53 @@ class TestInScopeNames (unittest.TestCase):
         xmlns_map = self.show(brandName)
         self.assertEqual(0, len(xmlns_map))
 
+    def testPostConstructionDeclaration (self):
+        # Use minidom directly: it leaves namespace contexts to be built
+        # by walking the DOM, rather than assigning them during the parse.
+        import xml.dom.minidom
+        root = xml.dom.minidom.parseString('<root xmlns:a="urn:a"><child/><other xmlns:b="urn:b"/></root>').documentElement
+        root_ctx = pyxb.namespace.NamespaceContext.GetNodeContext(root)
+        child = root.firstChild
+        other = child.nextSibling
+        child_ctx = pyxb.namespace.NamespaceContext.GetNodeContext(child)
+        self.assertEqual('urn:a', self.show(child)['a'].uri())
+        self.assertEqual(None, self.show(root).get('b'))
+        self.assertEqual('urn:b', self.show(other)['b'].uri())
+        ns = pyxb.namespace.NamespaceForURI('urn:c', create_if_missing=True)
+        root_ctx.declareNamespace(ns, 'c')
+        self.assertEqual('urn:c', self.show(root)['c'].uri())
+        self.assertEqual(None, self.show(child).get('c'))
+        child_ctx.declareNamespace(ns, 'cc')
+        self.assertEqual(None, self.show(root).get('cc'))
+        self.assertEqual(None, self.show(other).get('cc'))
+        self.assertEqual('urn:c', self.show(child)['cc'].uri())
+
+    def testUndeclaredMapUnmodified (self):
+        import xml.dom.minidom
+        from pyxb.namespace import builtin
+        initial = builtin._UndeclaredNamespaceMap.copy()
+        root = xml.dom.minidom.parseString('<root><child/></root>').documentElement
+        root_ctx = pyxb.namespace.NamespaceContext.GetNodeContext(root)
+        self.assertTrue(root_ctx.inScopeNamespaces() is builtin._UndeclaredNamespaceMap)
+        ns = pyxb.namespace.NamespaceForURI('urn:c', create_if_missing=True)
+        root_ctx.declareNamespace(ns, 'c')
+        root_ctx.processXMLNS(None, 'urn:d')
+        self.assertEqual('urn:c', self.show(root)['c'].uri())
+        self.assertEqual(None, self.show(root.firstChild).get('c'))
+        self.assertEqual(initial, builtin._UndeclaredNamespaceMap)
+
+    def testDeepDocument (self):
+        import xml.dom.minidom
+        depth = 2000
+        root = xml.dom.minidom.parseString(('<e xmlns:a="urn:a">' * depth) + ('</e>' * depth)).documentElement
+        node = root
+        while node.firstChild is not None:
+            node = node.firstChild
+        # Contexts for the whole tree are created from the root without
+        # exhausting the interpreter stack.
+        pyxb.namespace.NamespaceContext.GetNodeContext(root)
+        self.assertEqual('urn:a', self.show(node)['a'].uri())
+
 
 class TestNamespaceURIs (unittest.TestCase):
     # Make sure we agree with xml.dom on what the core namespace URIs are
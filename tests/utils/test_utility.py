@@ -352,6 +352,18 @@ class TestGraph (unittest.TestCase):
         self.assertEqual(1, len(graph.scc()))
         self.assertEqual(set([1, 3, 5]), set(graph.scc()[0]))
 
+    def testRootSetOrder (self):
+        graph = Graph()
+        graph.addEdge(1, 2)
+        graph.addEdge(1, 3)
+        graph.addEdge(3, 2)
+        graph.addEdge(4, 3)
+        graph.addNode(5)
+        order = graph.rootSetOrder()
+        self.assertEqual([ set([2, 5]), set([3]), set([1, 4]) ], order)
+        graph.addEdge(2, 4)
+        self.assertEqual(None, graph.rootSetOrder())
+
 import tempfile
 
 class _TestOpenOrCreate_mixin (object):
@@ -659,6 +671,14 @@ class TestGetMatchingFiles (unittest.TestCase):
         files = set(self._stripPath(GetMatchingFiles(self._formPath('d1', 'd2'), self.__WXS_re)))
         self.assertEqual(files, set(['d1/f1a.wxs', 'd1/f1b.wxs', 'd2/f2a.wxs']))
 
+    def testSuffix (self):
+        files = set(self._stripPath(GetMatchingFiles(self._formPath('d1'), '.wxs')))
+        self.assertEqual(files, set(['d1/f1b.wxs', 'd1/f1a.wxs']))
+        files = set(self._stripPath(GetMatchingFiles(self._formPath('d1', 'd2'), '.wxs')))
+        self.assertEqual(files, set(['d1/f1a.wxs', 'd1/f1b.wxs', 'd2/f2a.wxs']))
+        files = set(self._stripPath(GetMatchingFiles(self._formPath('d1//'), '.wxs')))
+        self.assertEqual(files, set(self._stripPath(GetMatchingFiles(self._formPath('d1//'), self.__WXS_re))))
+
     def testD1D2 (self):
         files = set(self._stripPath(GetMatchingFiles(self._formPath('d1', 'd2'))))
         self.assertEqual(files, set(['d1/f1a.wxs', 'd1/f1b.wxs', 'd1/f1c', 'd2/f2a.wxs', 'd2/f2b']))
@@ -736,5 +756,31 @@ class TestIteratedCompareMixed (unittest.TestCase):
         self.assertEqual(-1, IteratedCompareMixed((1, 2, 3), (1, 2, 3, -1)))
         self.assertEqual(1, IteratedCompareMixed((1, 2, 3, -1), (1, 2, 3)))
 
+class PT_base (PrivateTransient_mixin):
+    __PrivateTransient = set([ 'cache' ])
+    def __init__ (self):
+        self.__cache = 'base'
+        self.__kept = 'base'
+
+class PT_sub (PT_base):
+    __PrivateTransient = set([ 'scratch' ])
+    def __init__ (self):
+        super(PT_sub, self).__init__()
+        self.__scratch = None
+        self.__kept = 'sub'
+
+class TestPrivateTransient (unittest.TestCase):
+    def testBase (self):
+        state = PT_base().__getstate__()
+        self.assertEqual({ '_PT_base__kept' : 'base' }, state)
+
+    def testInherited (self):
+        instance = PT_sub()
+        for _ in range(2):
+            state = instance.__getstate__()
+            # Transient members are dropped only if they hold a value
+            self.assertEqual({ '_PT_base__kept' : 'base', '_PT_sub__kept' : 'sub', '_PT_sub__scratch' : None }, state)
+        self.assertTrue('_PT_base__cache' in instance.__dict__)
+
 if '__main__' == __name__:
     unittest.main()